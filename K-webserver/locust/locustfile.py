@@ -1,698 +1,683 @@
 #!/usr/bin/env python3
 
+import itertools
+import os
 import random
+import sys
 import time
-from locust import HttpUser, task, between
+from collections import deque
+
+import gevent
+import orjson
+from gevent.pool import Group
+from gevent.ssl import create_default_context
+from geventhttpclient.client import HTTPClientPool
+from locust import constant_throughput, events, task
+from locust.contrib.fasthttp import FastHttpSession, FastHttpUser, insecure_ssl_context_factory
+from locust.runners import MasterRunner
+
+# Every pooled keep-alive socket is a file descriptor, so lift the soft
+# open-file limit to the hard limit for headroom (resource is POSIX-only)
+if sys.platform != "win32":
+    import resource
+
+    _soft, _hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if _hard != resource.RLIM_INFINITY and _soft < _hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (_hard, _hard))
+        except (ValueError, OSError):
+            # e.g. macOS caps below the hard limit; keep the current limit,
+            # Locust raises it to 10000 itself afterwards if it can
+            pass
+
+# TLS certificates are verified by default. Set K_LOCUST_INSECURE_TLS=1 against
+# local or staging targets with self-signed certificates to skip certificate and
+# hostname checks; the shared pool needs the insecure context factory for that,
+# since its `insecure` flag alone only turns off the hostname check.
+INSECURE_TLS = os.environ.get("K_LOCUST_INSECURE_TLS", "0") == "1"
+
+# Connection pool shared by every simulated user in this worker process, so
+# keep-alive sockets are reused across users instead of one pool per user.
+# Timeouts live on the pool because a shared pool builds its own clients, and
+# its concurrency is the socket cap per host for all users together; it is sized
+# so heavy-load bursts never queue behind an exhausted pool.
+# With K_LOCUST_PER_USER_POOL=1 every simulated user gets its own pool instead,
+# capped by its class `concurrency`, so connections spread across the backends
+# of a connection-balanced load balancer the way independent clients would.
+PER_USER_POOL = os.environ.get("K_LOCUST_PER_USER_POOL", "0") == "1"
+CLIENT_POOL = None if PER_USER_POOL else HTTPClientPool(
+    concurrency=5000, connection_timeout=5.0, network_timeout=10.0, insecure=INSECURE_TLS,
+    ssl_context_factory=insecure_ssl_context_factory if INSECURE_TLS else create_default_context,
+)
+
+# Ask for keep-alive explicitly so sockets stay warm for the whole run.
+# Runbook: on the webserver host enable `sysctl -w net.ipv4.tcp_tw_reuse=1` so
+# any connections that do close don't pile up in TIME_WAIT, and check with
+# `ss -s` during a run that ESTABLISHED stays flat and TIME_WAIT doesn't grow.
+DEFAULT_HEADERS = {"Connection": "keep-alive"}
+
+# Real public keys from k-db-DEV (22 users)
+SAMPLE_PUBKEYS = (
+    "03edeacd90b1fe7ee696e21ddd81083fd44a245642a4a5cade455c465c9ce80e1b",
+    "032c1de780180d4e5100e17e304996284d187fdeb5ac837f32c04d62b73aaefe18",
+    "03f5a6fde99bc8e9ab6c6c92a08bafe622e533c7dad7f4eec2edef35baaa5a9bc6",
+    "0280bc073a2f016dbd6df25c4e843a5f801d3d940fc384d79f8103e42297be5986",
+    "020bc57bc1fb10751dc18282931a07cd6ace772217f0c4d843bc2b1a71670d7de1",
+    "03b1f9ed63976b28ad4e648b9da672679bd27895def79159f372eeea30df45abf7",
+    "0367ff507f241fa0b4e90779952d7ed36731a77021db0982fbabd0fbfa036bd8ee",
+    "030fd8f1b20f57abf99d61c95db9a149c5a9e0502817ba257d6adf32d0a4708ebe",
+    "02405d3f51e96e18ebe1894242551baf10edd5307721b761a8a1e5d3a8df8817f9",
+    "0327900e8385a066dff50e90c1851a39ed107cf90897b6fad0da63020bb8327fbd",
+    "02dd3235798995ebc348613b7403d5bfbc277b3e3b7414ce3e166f4adacff7f532",
+    "038f29db80e35e9086adc7af56383625bb7dc5cf3690bc092dcd210039db3d825d",
+    "02bddf1f69dc78dcc8c656a7d9a8bc65256e26bbac970ef2c23e2f5e0982112d65",
+    "033d01709a02bf78f95e09cd00ba93ad8fb7c8ac11e6d3f871a11062eeb2aa8cd8",
+    "038ea9ca1fe1f22cc8074cc576e0870cf50f773c90c1f4830fd6ba6f60771cc1f3",
+    "02218b3732df2353978154ec5323b745bce9520a5ed506a96de4f4e3dad20dc44f",
+    "03f56f6ad1c1166e330fb2897ae60afcb25afa10006212cfee24264c04d21bce60",
+    "0223ca2161f47a142e77f85c398b839a65b8c799e22968d3214a25aee616bd00b6",
+    "0327c058e497477d175674381a30ff36e5309f7c0f5bc9dc683506de6549e40562",
+    "024d3fe4f26cd652d91f4173c7517af9c0254de833cc25924fc2d475768008fd15",
+    "0207e2bd14de5a9e7e39b00437cfe58ad64af128678485029b5fe304b841d1b076",
+    "03466b99d7ca36044fdc1c486d0c40c1ecf024f54554377fb005a40b16b08637cc",
+)
+
+# Real content IDs from k_contents (posts/quotes) - 40 items
+SAMPLE_POST_IDS = (
+    "40dfcbfff3ad1c8a0c80bfd8bddf574b75a796d644c4f508ae63f7e47ed3d2bf",
+    "7c0b5d4d995eb86b076ab787a96c9d1180219a7dfc8de419b7dd0958e02723d9",
+    "b1c455ffdbf96f8199641a0ef42d96f55d7261b4abd3c28d7eb384742e098e82",
+    "0e5b63242a970cc5fb567dd71c223a62a74507821fc1b9fe5eb3df9c258ffce8",
+    "996bc414134275c4d8638e339f1a30e88da4f495219ae7494ddafd2e413d5c3a",
+    "a9ef66ac8fec30431547a2c3e71fbbf7a04f859f5800177cd0f93abc69b10ae3",
+    "7401c334fed3383d73a96f3d46c2cbad93d70798f469eaf93e985994fcd805dc",
+    "e0893f1f8d990f2672a5d30c90c3bc0982899fd645a71785f268161d8e1ab8c0",
+    "e6ff72cc7958f5ef6beaf5660b6ba95787758a2d3fe405adf9864ee3eadd37d0",
+    "631857e3ad73a2e5c05b193b56fcd9d9c89dc40daad06d0e4b1f7128d660f4d0",
+    "8035e96070ec133288f8be16b2885c23740ccaf2558d4d5d868256814dd23aff",
+    "2c7f16c10ecffe3f845cfa0e06fd5cdceb87f30c9938ef9ca24918b2d5b96cb6",
+    "9d2ffa4aab2ecd054d3ed2d760aa800fc35c028a064595ebd8bbd907f74a6fcf",
+    "e26b14bfde54bbed157aeb85d358e22c8e6fb21d5503cf86b63dc97a246df85b",
+    "889bb1cc99260789e570be64513ff4afa65982eaa920ddb3ebc7ca58f09a38fe",
+    "c8f371509f38638a05aab45bef069574736b38f837ed2c6eacfed59c099e3f8c",
+    "e1b110094f672b02ceec8a2949cdeb1ceaf498422b91d2774b1b9e127e41cde4",
+    "91a489d1c0202a49b830bf3a0ed6570d7a1b3051e16397d5052b99bd4d51d805",
+    "239605f8e78044793cad47f6dc36df7a991152c45469cd4a4a0d383dc55dcb6d",
+    "17088141aba4e07dccb515dfbda3106480d7c65b64e2ba7ff70f9e87715280f6",
+    "e3bf67aa5b1aa53096b742afa382fcc60c370b4cf8d3942c423247d9925cebeb",
+    "6ee1dc36863c391e02ec290445fed2c36f534d937d84acd74c7495ead78b4874",
+    "85bc33d5e5daf886158f796eaea614894f730f212e339edbe92962714fa793fd",
+    "1fde0de5ff86edac61e09fa2f1588f7ff140ee036a500a6f6ccbadb4304d38a5",
+    "62ae89ffd92ffabf040d820cd00f23fa6c1bc2ad02ddd630a71ba5244da19862",
+    "17a9c41ad5e935a7e0448bfbfe2ec779d35cdefb785d4e0a5958733d9ddfeae2",
+    "f3e9e85eb3c6e594bc26d4b83b31214332af7b26a0bb15849300a8d172346139",
+    "7bd455cc044a035b1cc7ee911207cbcda692ee3b453e48710ed626190e384688",
+    "a295cf6cee11a75b7f32a376d3c6c918d6b64668c3b4665df2bcf5bde21627f0",
+    "634c4cee207a386602bafcd7db95c1a77f14fc322c89e21fc33d2d641e714b05",
+    "5e37c2ac01628876bc368530d625ee7d9622026e7e494707d1e3024bd26b5d4b",
+    "4a5bc584d79539a225e2916cb47cbbf7e54b4ff4244f640a3acd43b4ec79f3f7",
+    "06448fcb7dfb7a6e68e7b421302fac2c2d9c5d678127f9e746e9047c3ca455b1",
+    "7b62f663652ae758d1b2daa7f6ee8b1e260dc65ad6bdf6f233c2452f6cd31066",
+    "7ab4535d619ab06095825d312221227769ac856d8e8dc3ed7c88829052567730",
+    "fdd2788f42aa3903fd9f4b86f2ae32162f9da7be2dcc4760aba69d65139c9bac",
+    "34d6b4d2ed35cc4cf010809985a681f403555e3e3704edca6135a5b9d7771171",
+    "df5f1d79531f75e33fa9c534c1362fc6d42f561854f29c69f4893fa73f03560d",
+    "855bed8163845d91bb12fa724f5e9d14a06769c6b38a26acaf2be406bfdc68ad",
+    "12eb841d2c281c6c3eb6c3c09fbe4b161d10e3c8a321c06e7b859b8dd1d43168",
+)
+
+# Users who follow others (for following-related endpoints)
+USERS_WITH_FOLLOWS = (
+    "0367ff507f241fa0b4e90779952d7ed36731a77021db0982fbabd0fbfa036bd8ee",
+    "038ea9ca1fe1f22cc8074cc576e0870cf50f773c90c1f4830fd6ba6f60771cc1f3",
+    "03edeacd90b1fe7ee696e21ddd81083fd44a245642a4a5cade455c465c9ce80e1b",
+    "02299c80be550c23bfe10954cf7f3c62a9f8e9af45df3a62ab665633a5e8b32c87",
+    "03f5a6fde99bc8e9ab6c6c92a08bafe622e533c7dad7f4eec2edef35baaa5a9bc6",
+)
+
+# Public keys used by the heavy load and realistic users (22 users)
+LOAD_TEST_PUBKEYS = (
+    "03edeacd90b1fe7ee696e21ddd81083fd44a245642a4a5cade455c465c9ce80e1b",
+    "032c1de780180d4e5100e17e304996284d187fdeb5ac837f32c04d62b73aaefe18",
+    "03f5a6fde99bc8e9ab6c6c92a08bafe622e533c7dad7f4eec2edef35baaa5a9bc6",
+    "0280bc073a2f016dbd6df25c4e843a5f801d3d940fc384d79f8103e42297be5986",
+    "020bc57bc1fb10751dc18282931a07cd6ace772217f0c4d843bc2b1a71670d7de1",
+    "02b1c109f322e0ee42c75434cd2c45c1e2e6dd09ad8127dbf3f0d9bb25ddf15f6b",
+    "03e5a3ad26b8df8e67e0b23b8e1e70a4adc2b05a6a6d3f3c47ca47c53e97f4b741",
+    "02e7c8a2e8e9c0c4a2b4a1e2d1c3b4a5e6f7c8d9e0a1b2c3d4e5f6a7b8c9d0e1f2",
+    "03a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2",
+    "0367ff507f241fa0b4e90779952d7ed36731a77021db0982fbabd0fbfa036bd8ee",
+    "038ea9ca1fe1f22cc8074cc576e0870cf50f773c90c1f4830fd6ba6f60771cc1f3",
+    "02f1e2d3c4b5a6978695a4b3c2d1e0f9e8d7c6b5a4938271605f4e3d2c1b0a9f8e",
+    "03c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2",
+    "02d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2",
+    "03b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2",
+    "02a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2",
+    "03d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2",
+    "02c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2",
+    "03e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2",
+    "02e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2",
+    "03f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2",
+    "02f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2",
+)
+
+# Content IDs used by the heavy load and realistic users - 40 items
+LOAD_TEST_POST_IDS = (
+    "40dfcbfff3ad1c8a0c80bfd8bddf574b75a796d644c4f508ae63f7e47ed3d2bf",
+    "7c0b5d4d995eb86b076ab787a96c9d1180219a7dfc8de419b7dd0958e02723d9",
+    "b1c455ffdbf96f8199641a0ef42d96f55d7261b4abd3c28d7eb384742e098e82",
+    "0e5b63242a970cc5fb567dd71c223a62a74507821fc1b9fe5eb3df9c258ffce8",
+    "89c3a29ff0c89bef82e2e6c8c4a5f3b7d1e9f4a2b8c6d3e7f1a5b9c2d8e4f7a1b6",
+    "1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3",
+    "2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4",
+    "3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5",
+    "4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6",
+    "5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7",
+    "6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8",
+    "7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9",
+    "8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0",
+    "9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1",
+    "a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3",
+    "b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4",
+    "c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5",
+    "d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6",
+    "e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7",
+    "f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8",
+    "a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9",
+    "b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0",
+    "c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1",
+    "d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2",
+    "e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3",
+    "f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4",
+    "a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5",
+    "b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6",
+    "c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7",
+    "d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8",
+    "e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9",
+    "f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0",
+    "a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1",
+    "b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2",
+    "c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3",
+    "d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4",
+    "e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5",
+    "f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6",
+    "a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7",
+    "b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8",
+)
+
+# Subset of USERS_WITH_FOLLOWS used by the realistic user
+LOAD_TEST_USERS_WITH_FOLLOWS = USERS_WITH_FOLLOWS[:3]
+
+# Pagination cursors go back between one hour and one day, in microseconds
+_US_MIN = 3_600_000_000
+_US_MAX = 86_400_000_000
+
+# Cursor timestamps snap to 5-minute buckets and the id half comes from a small
+# fixed set, so simulated users share server-side cache keys
+_CURSOR_BUCKET_US = 300_000_000
+_CURSOR_IDS = ("1", "250", "500", "750", "1000")
+
+# Endpoint URL templates; every value substituted here is hex or digits, so no escaping is needed
+_URL_POSTS_WATCHING = "/get-posts-watching?requesterPubkey={r}&limit={l}"
+_URL_CONTENT_FOLLOWING = "/get-content-following?requesterPubkey={r}&limit={l}"
+_URL_MENTIONS = "/get-mentions?user={u}&requesterPubkey={r}&limit={l}"
+_URL_NOTIFICATIONS = "/get-notifications?user={u}&requesterPubkey={r}&limit={l}"
+_URL_NOTIFICATION_COUNT = "/get-notification-count?requesterPubkey={r}&user={u}"
+_URL_USERS = "/get-users?requesterPubkey={r}&limit={l}"
+_URL_POSTS = "/get-posts?user={u}&requesterPubkey={r}&limit={l}"
+_URL_REPLIES_BY_POST = "/get-replies?post={p}&requesterPubkey={r}&limit={l}"
+_URL_REPLIES_BY_USER = "/get-replies?user={u}&requesterPubkey={r}&limit={l}"
+_URL_POST_DETAILS = "/get-post-details?requesterPubkey={r}&id={p}"
+_URL_USER_DETAILS = "/get-user-details?requesterPubkey={r}&user={u}"
+_URL_BLOCKED_USERS = "/get-blocked-users?requesterPubkey={r}&limit={l}"
+_URL_FOLLOWED_USERS = "/get-followed-users?requesterPubkey={r}&limit={l}"
+_BEFORE_FMT = "&before={b}"
+
+# Page sizes as ready-made strings, so URL building skips the int -> str step
+_LIMIT_STRS = tuple(str(i) for i in range(101))
+
+# rapid_pagination_test walks back 1, 2 and 3 hours
+_PAGINATION_OFFSETS_US = (3_600_000_000, 7_200_000_000, 10_800_000_000)
+
+# Wall clock in microseconds, refreshed once a second by a background greenlet
+# so task bodies read a list slot instead of calling time.time_ns(); cursors
+# are bucketed to 5 minutes, so 1-second resolution is plenty.
+_NOW_US = [time.time_ns() // 1000]
+_clock_ticker = None
+
+
+def _tick_clock():
+    while True:
+        gevent.sleep(1.0)
+        _NOW_US[0] = time.time_ns() // 1000
+
+
+@events.test_start.add_listener
+def _start_clock(environment, **kwargs):
+    global _clock_ticker
+    _NOW_US[0] = time.time_ns() // 1000
+    if _clock_ticker is None:
+        _clock_ticker = gevent.spawn(_tick_clock)
+
+
+@events.test_stop.add_listener
+def _stop_clock(environment, **kwargs):
+    global _clock_ticker
+    if _clock_ticker is not None:
+        _clock_ticker.kill()
+        _clock_ticker = None
+
+
+def _bucket(ts_us):
+    """Round a microsecond timestamp down to its cursor bucket"""
+    return ts_us - ts_us % _CURSOR_BUCKET_US
+
+
+def _before_cursor(rng):
+    """Build a random `before` cursor (`<timestamp_us>_<id>`) in the recent past"""
+    return f"{_bucket(_NOW_US[0] - rng.randrange(_US_MIN, _US_MAX))}_{rng.choice(_CURSOR_IDS)}"
+
+
+def _failure_message(response):
+    """Status plus at most 200 raw body bytes, without decoding the whole body as text"""
+    return f"Got {response.status_code}: {(response.content or b'')[:200]!r}"
+
+
+def _check_found(response):
+    """Mark a catch_response result; 404 counts as success (the user simply has no data)"""
+    if response.status_code == 200 or response.status_code == 404:
+        response.success()
+    else:
+        response.failure(_failure_message(response))
+
+
+def _cycled_choices(population, rng, size=256):
+    """Pre-roll `size` random picks from population; the returned callable cycles through them"""
+    return itertools.cycle(rng.choices(population, k=size)).__next__
+
 
-class KWebappAPIUser(HttpUser):
-    wait_time = between(1, 3)
+def _cycled_flips(probability, rng, size=1024):
+    """Pre-roll `size` biased coin flips; the returned callable cycles through them"""
+    return itertools.cycle([rng.random() < probability for _ in range(size)]).__next__
 
-    def on_start(self):
-        """Initialize test data for API calls with REAL data from DEV database"""
-        # Real public keys from k-db-DEV (30 users)
-        self.sample_pubkeys = [
-            "03edeacd90b1fe7ee696e21ddd81083fd44a245642a4a5cade455c465c9ce80e1b",
-            "032c1de780180d4e5100e17e304996284d187fdeb5ac837f32c04d62b73aaefe18",
-            "03f5a6fde99bc8e9ab6c6c92a08bafe622e533c7dad7f4eec2edef35baaa5a9bc6",
-            "0280bc073a2f016dbd6df25c4e843a5f801d3d940fc384d79f8103e42297be5986",
-            "020bc57bc1fb10751dc18282931a07cd6ace772217f0c4d843bc2b1a71670d7de1",
-            "03b1f9ed63976b28ad4e648b9da672679bd27895def79159f372eeea30df45abf7",
-            "0367ff507f241fa0b4e90779952d7ed36731a77021db0982fbabd0fbfa036bd8ee",
-            "030fd8f1b20f57abf99d61c95db9a149c5a9e0502817ba257d6adf32d0a4708ebe",
-            "02405d3f51e96e18ebe1894242551baf10edd5307721b761a8a1e5d3a8df8817f9",
-            "0327900e8385a066dff50e90c1851a39ed107cf90897b6fad0da63020bb8327fbd",
-            "02dd3235798995ebc348613b7403d5bfbc277b3e3b7414ce3e166f4adacff7f532",
-            "038f29db80e35e9086adc7af56383625bb7dc5cf3690bc092dcd210039db3d825d",
-            "02bddf1f69dc78dcc8c656a7d9a8bc65256e26bbac970ef2c23e2f5e0982112d65",
-            "033d01709a02bf78f95e09cd00ba93ad8fb7c8ac11e6d3f871a11062eeb2aa8cd8",
-            "038ea9ca1fe1f22cc8074cc576e0870cf50f773c90c1f4830fd6ba6f60771cc1f3",
-            "02218b3732df2353978154ec5323b745bce9520a5ed506a96de4f4e3dad20dc44f",
-            "03f56f6ad1c1166e330fb2897ae60afcb25afa10006212cfee24264c04d21bce60",
-            "0223ca2161f47a142e77f85c398b839a65b8c799e22968d3214a25aee616bd00b6",
-            "0327c058e497477d175674381a30ff36e5309f7c0f5bc9dc683506de6549e40562",
-            "024d3fe4f26cd652d91f4173c7517af9c0254de833cc25924fc2d475768008fd15",
-            "0207e2bd14de5a9e7e39b00437cfe58ad64af128678485029b5fe304b841d1b076",
-            "03466b99d7ca36044fdc1c486d0c40c1ecf024f54554377fb005a40b16b08637cc"
-        ]
 
-        # Real content IDs from k_contents (posts/quotes) - 40 items
-        self.sample_post_ids = [
-            "40dfcbfff3ad1c8a0c80bfd8bddf574b75a796d644c4f508ae63f7e47ed3d2bf",
-            "7c0b5d4d995eb86b076ab787a96c9d1180219a7dfc8de419b7dd0958e02723d9",
-            "b1c455ffdbf96f8199641a0ef42d96f55d7261b4abd3c28d7eb384742e098e82",
-            "0e5b63242a970cc5fb567dd71c223a62a74507821fc1b9fe5eb3df9c258ffce8",
-            "996bc414134275c4d8638e339f1a30e88da4f495219ae7494ddafd2e413d5c3a",
-            "a9ef66ac8fec30431547a2c3e71fbbf7a04f859f5800177cd0f93abc69b10ae3",
-            "7401c334fed3383d73a96f3d46c2cbad93d70798f469eaf93e985994fcd805dc",
-            "e0893f1f8d990f2672a5d30c90c3bc0982899fd645a71785f268161d8e1ab8c0",
-            "e6ff72cc7958f5ef6beaf5660b6ba95787758a2d3fe405adf9864ee3eadd37d0",
-            "631857e3ad73a2e5c05b193b56fcd9d9c89dc40daad06d0e4b1f7128d660f4d0",
-            "8035e96070ec133288f8be16b2885c23740ccaf2558d4d5d868256814dd23aff",
-            "2c7f16c10ecffe3f845cfa0e06fd5cdceb87f30c9938ef9ca24918b2d5b96cb6",
-            "9d2ffa4aab2ecd054d3ed2d760aa800fc35c028a064595ebd8bbd907f74a6fcf",
-            "e26b14bfde54bbed157aeb85d358e22c8e6fb21d5503cf86b63dc97a246df85b",
-            "889bb1cc99260789e570be64513ff4afa65982eaa920ddb3ebc7ca58f09a38fe",
-            "c8f371509f38638a05aab45bef069574736b38f837ed2c6eacfed59c099e3f8c",
-            "e1b110094f672b02ceec8a2949cdeb1ceaf498422b91d2774b1b9e127e41cde4",
-            "91a489d1c0202a49b830bf3a0ed6570d7a1b3051e16397d5052b99bd4d51d805",
-            "239605f8e78044793cad47f6dc36df7a991152c45469cd4a4a0d383dc55dcb6d",
-            "17088141aba4e07dccb515dfbda3106480d7c65b64e2ba7ff70f9e87715280f6",
-            "e3bf67aa5b1aa53096b742afa382fcc60c370b4cf8d3942c423247d9925cebeb",
-            "6ee1dc36863c391e02ec290445fed2c36f534d937d84acd74c7495ead78b4874",
-            "85bc33d5e5daf886158f796eaea614894f730f212e339edbe92962714fa793fd",
-            "1fde0de5ff86edac61e09fa2f1588f7ff140ee036a500a6f6ccbadb4304d38a5",
-            "62ae89ffd92ffabf040d820cd00f23fa6c1bc2ad02ddd630a71ba5244da19862",
-            "17a9c41ad5e935a7e0448bfbfe2ec779d35cdefb785d4e0a5958733d9ddfeae2",
-            "f3e9e85eb3c6e594bc26d4b83b31214332af7b26a0bb15849300a8d172346139",
-            "7bd455cc044a035b1cc7ee911207cbcda692ee3b453e48710ed626190e384688",
-            "a295cf6cee11a75b7f32a376d3c6c918d6b64668c3b4665df2bcf5bde21627f0",
-            "634c4cee207a386602bafcd7db95c1a77f14fc322c89e21fc33d2d641e714b05",
-            "5e37c2ac01628876bc368530d625ee7d9622026e7e494707d1e3024bd26b5d4b",
-            "4a5bc584d79539a225e2916cb47cbbf7e54b4ff4244f640a3acd43b4ec79f3f7",
-            "06448fcb7dfb7a6e68e7b421302fac2c2d9c5d678127f9e746e9047c3ca455b1",
-            "7b62f663652ae758d1b2daa7f6ee8b1e260dc65ad6bdf6f233c2452f6cd31066",
-            "7ab4535d619ab06095825d312221227769ac856d8e8dc3ed7c88829052567730",
-            "fdd2788f42aa3903fd9f4b86f2ae32162f9da7be2dcc4760aba69d65139c9bac",
-            "34d6b4d2ed35cc4cf010809985a681f403555e3e3704edca6135a5b9d7771171",
-            "df5f1d79531f75e33fa9c534c1362fc6d42f561854f29c69f4893fa73f03560d",
-            "855bed8163845d91bb12fa724f5e9d14a06769c6b38a26acaf2be406bfdc68ad",
-            "12eb841d2c281c6c3eb6c3c09fbe4b161d10e3c8a321c06e7b859b8dd1d43168"
-        ]
+# Health checks are system-level rather than a per-user task: one greenlet per
+# worker process probes /health every few seconds, independent of user count.
+HEALTH_CHECK_INTERVAL = 5.0
+_health_pinger = None
 
-        # Users who follow others (for following-related endpoints)
-        self.users_with_follows = [
-            "0367ff507f241fa0b4e90779952d7ed36731a77021db0982fbabd0fbfa036bd8ee",
-            "038ea9ca1fe1f22cc8074cc576e0870cf50f773c90c1f4830fd6ba6f60771cc1f3",
-            "03edeacd90b1fe7ee696e21ddd81083fd44a245642a4a5cade455c465c9ce80e1b",
-            "02299c80be550c23bfe10954cf7f3c62a9f8e9af45df3a62ab665633a5e8b32c87",
-            "03f5a6fde99bc8e9ab6c6c92a08bafe622e533c7dad7f4eec2edef35baaa5a9bc6"
-        ]
+
+def _ping_health(session):
+    while True:
+        gevent.sleep(HEALTH_CHECK_INTERVAL)
+        session.get("/health", name="/health")
+
+
+@events.test_start.add_listener
+def _start_health_pinger(environment, **kwargs):
+    global _health_pinger
+    if isinstance(environment.runner, MasterRunner) or not environment.host or _health_pinger is not None:
+        return
+    session = FastHttpSession(environment, base_url=environment.host, user=None,
+                              client_pool=CLIENT_POOL, headers=DEFAULT_HEADERS, insecure=INSECURE_TLS)
+    _health_pinger = gevent.spawn(_ping_health, session)
+
+
+@events.test_stop.add_listener
+def _stop_health_pinger(environment, **kwargs):
+    global _health_pinger
+    if _health_pinger is not None:
+        _health_pinger.kill()
+        _health_pinger = None
+
+
+class _KWebappUser(FastHttpUser):
+    """Connection settings and per-user state shared by every K-webapp user class"""
+    abstract = True
+    # Subclasses set `concurrency`, but Locust ignores it when client_pool is set,
+    # so it only caps connections with K_LOCUST_PER_USER_POOL=1
+    network_timeout = 10.0
+    connection_timeout = 5.0
+    client_pool = CLIENT_POOL
+    default_headers = DEFAULT_HEADERS
+    insecure = INSECURE_TLS
+
+    def on_start(self):
+        """Per-user RNG and requester; subclasses set sample_pubkeys and extend this"""
+        # Per-user generator, so greenlets don't share the module-level one
+        self._rand = random.Random()
 
         # Default requester pubkey
-        self.requester_pubkey = random.choice(self.sample_pubkeys)
+        self.requester_pubkey = self._rand.choice(self.sample_pubkeys)
+
+
+class KWebappAPIUser(_KWebappUser):
+    # Fixed task rate per user (open-model-like), so a slow server doesn't throttle
+    # the offered load; matches the mean of the old between(1, 3) think time
+    wait_time = constant_throughput(0.5)
+    concurrency = 10
+
+    # Test data with REAL data from DEV database, bound once per class
+    sample_pubkeys = SAMPLE_PUBKEYS
+    sample_post_ids = SAMPLE_POST_IDS
+    users_with_follows = USERS_WITH_FOLLOWS
+
+    def on_start(self):
+        """Initialize per-user state for API calls"""
+        super().on_start()
+
+        # URL prefixes ending in "limit=", so only the drawn limit is appended per request
+        self._watching_url = _URL_POSTS_WATCHING.format(r=self.requester_pubkey, l="")
+        self._users_url = _URL_USERS.format(r=self.requester_pubkey, l="")
+        self._blocked_users_url = _URL_BLOCKED_USERS.format(r=self.requester_pubkey, l="")
+
+        # Fixed-shape lookups put requesterPubkey first, so only the looked-up ID is appended
+        self._notification_count_url = _URL_NOTIFICATION_COUNT.format(r=self.requester_pubkey, u="")
+        self._post_details_url = _URL_POST_DETAILS.format(r=self.requester_pubkey, p="")
+        self._user_details_url = _URL_USER_DETAILS.format(r=self.requester_pubkey, u="")
+
+        # Pre-drawn random picks for the task bodies
+        self._next_pubkey = _cycled_choices(self.sample_pubkeys, self._rand)
+        self._next_post_id = _cycled_choices(self.sample_post_ids, self._rand)
+        self._next_follower = _cycled_choices(self.users_with_follows, self._rand)
+        self._next_limit_30 = _cycled_choices(_LIMIT_STRS[10:31], self._rand)
+        self._next_limit_50 = _cycled_choices(_LIMIT_STRS[10:51], self._rand)
+        self._next_limit_100 = _cycled_choices(_LIMIT_STRS[10:101], self._rand)
+        self._coin_30 = _cycled_flips(0.3, self._rand)
+        self._coin_20 = _cycled_flips(0.2, self._rand)
+        self._coin_replies_by_post = _cycled_flips(4 / 7, self._rand)
+
+    def _maybe_paginate(self, url, coin):
+        """Append a random `before` cursor when the pre-rolled coin comes up"""
+        if coin():
+            return url + _BEFORE_FMT.format(b=_before_cursor(self._rand))
+        return url
 
     @task(5)
     def get_posts_watching(self):
         """Test get-posts-watching endpoint (global feed)"""
-        params = {
-            'requesterPubkey': self.requester_pubkey,
-            'limit': random.randint(10, 50)
-        }
+        url = self._watching_url + self._next_limit_50()
 
         # Add pagination parameters occasionally
-        if random.random() < 0.3:
-            params['before'] = f"{int(time.time() * 1000000) - random.randint(3600000000, 86400000000)}_{random.randint(1, 1000)}"
+        url = self._maybe_paginate(url, self._coin_30)
 
-        with self.client.get("/get-posts-watching", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-posts-watching")
 
     @task(3)
     def get_content_following(self):
         """Test get-content-following endpoint (following feed)"""
-        params = {
-            'requesterPubkey': random.choice(self.users_with_follows),
-            'limit': random.randint(10, 50)
-        }
+        url = _URL_CONTENT_FOLLOWING.format(r=self._next_follower(), l=self._next_limit_50())
 
         # Add pagination parameters occasionally
-        if random.random() < 0.3:
-            params['before'] = f"{int(time.time() * 1000000) - random.randint(3600000000, 86400000000)}_{random.randint(1, 1000)}"
+        url = self._maybe_paginate(url, self._coin_30)
 
-        with self.client.get("/get-content-following", params=params,
+        with self.client.get(url, name="/get-content-following",
                            catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            elif response.status_code == 404:
-                # 404 is valid - user has no following relationships
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+            _check_found(response)
 
     @task(2)
     def get_mentions(self):
         """Test get-mentions endpoint"""
-        params = {
-            'user': random.choice(self.sample_pubkeys),
-            'requesterPubkey': self.requester_pubkey,
-            'limit': random.randint(10, 30)
-        }
+        url = _URL_MENTIONS.format(u=self._next_pubkey(), r=self.requester_pubkey, l=self._next_limit_30())
 
         # Add pagination parameters occasionally
-        if random.random() < 0.2:
-            params['before'] = f"{int(time.time() * 1000000) - random.randint(3600000000, 86400000000)}_{random.randint(1, 1000)}"
+        url = self._maybe_paginate(url, self._coin_20)
 
-        with self.client.get("/get-mentions", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-mentions")
 
     @task(3)
     def get_notifications(self):
         """Test get-notifications endpoint"""
-        params = {
-            'user': random.choice(self.sample_pubkeys),
-            'requesterPubkey': self.requester_pubkey,
-            'limit': random.randint(10, 30)
-        }
+        url = _URL_NOTIFICATIONS.format(u=self._next_pubkey(), r=self.requester_pubkey, l=self._next_limit_30())
 
         # Add pagination parameters occasionally
-        if random.random() < 0.2:
-            params['before'] = f"{int(time.time() * 1000000) - random.randint(3600000000, 86400000000)}_{random.randint(1, 1000)}"
+        url = self._maybe_paginate(url, self._coin_20)
 
-        with self.client.get("/get-notifications", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-notifications")
 
     @task(1)
     def get_notification_count(self):
         """Test get-notification-count endpoint"""
-        params = {
-            'user': random.choice(self.sample_pubkeys),
-            'requesterPubkey': self.requester_pubkey
-        }
+        url = self._notification_count_url + self._next_pubkey()
 
-        with self.client.get("/get-notification-count", params=params,
+        with self.client.get(url, name="/get-notification-count",
                            catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            elif response.status_code == 404:
-                # 404 is valid - user has no notifications
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+            _check_found(response)
 
     @task(2)
     def get_users(self):
         """Test get-users endpoint (broadcasts/introductions)"""
-        params = {
-            'requesterPubkey': self.requester_pubkey,
-            'limit': random.randint(10, 100)
-        }
+        url = self._users_url + self._next_limit_100()
 
         # Add pagination parameters occasionally
-        if random.random() < 0.2:
-            params['before'] = f"{int(time.time() * 1000000) - random.randint(3600000000, 86400000000)}_{random.randint(1, 1000)}"
+        url = self._maybe_paginate(url, self._coin_20)
 
-        with self.client.get("/get-users", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-users")
 
     @task(6)
     def get_posts(self):
         """Test get-posts endpoint (user posts)"""
-        params = {
-            'user': random.choice(self.sample_pubkeys),
-            'requesterPubkey': self.requester_pubkey,
-            'limit': random.randint(10, 50)
-        }
+        url = _URL_POSTS.format(u=self._next_pubkey(), r=self.requester_pubkey, l=self._next_limit_50())
 
         # Add pagination parameters occasionally
-        if random.random() < 0.3:
-            params['before'] = f"{int(time.time() * 1000000) - random.randint(3600000000, 86400000000)}_{random.randint(1, 1000)}"
+        url = self._maybe_paginate(url, self._coin_30)
 
-        with self.client.get("/get-posts", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
-
-    @task(4)
-    def get_replies_by_post(self):
-        """Test get-replies endpoint for specific post"""
-        params = {
-            'post': random.choice(self.sample_post_ids),
-            'requesterPubkey': self.requester_pubkey,
-            'limit': random.randint(10, 30)
-        }
+        self.client.get(url, name="/get-posts")
 
-        # Add pagination parameters occasionally
-        if random.random() < 0.2:
-            params['before'] = f"{int(time.time() * 1000000) - random.randint(3600000000, 86400000000)}_{random.randint(1, 1000)}"
-
-        with self.client.get("/get-replies", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
-
-    @task(3)
-    def get_replies_by_user(self):
-        """Test get-replies endpoint for specific user"""
-        params = {
-            'user': random.choice(self.sample_pubkeys),
-            'requesterPubkey': self.requester_pubkey,
-            'limit': random.randint(10, 30)
-        }
+    @task(7)
+    def get_replies(self):
+        """Test get-replies endpoint, for a specific post (4 in 7) or a specific user (3 in 7)"""
+        if self._coin_replies_by_post():
+            url = _URL_REPLIES_BY_POST.format(p=self._next_post_id(), r=self.requester_pubkey, l=self._next_limit_30())
+        else:
+            url = _URL_REPLIES_BY_USER.format(u=self._next_pubkey(), r=self.requester_pubkey, l=self._next_limit_30())
 
         # Add pagination parameters occasionally
-        if random.random() < 0.2:
-            params['before'] = f"{int(time.time() * 1000000) - random.randint(3600000000, 86400000000)}_{random.randint(1, 1000)}"
+        url = self._maybe_paginate(url, self._coin_20)
 
-        with self.client.get("/get-replies", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-replies")
 
     @task(4)
     def get_post_details(self):
         """Test get-post-details endpoint"""
-        params = {
-            'id': random.choice(self.sample_post_ids),
-            'requesterPubkey': self.requester_pubkey
-        }
+        url = self._post_details_url + self._next_post_id()
 
-        with self.client.get("/get-post-details", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-post-details")
 
     @task(2)
     def get_user_details(self):
         """Test get-user-details endpoint"""
-        params = {
-            'user': random.choice(self.sample_pubkeys),
-            'requesterPubkey': self.requester_pubkey
-        }
+        url = self._user_details_url + self._next_pubkey()
 
-        with self.client.get("/get-user-details", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-user-details")
 
     @task(1)
     def get_blocked_users(self):
         """Test get-blocked-users endpoint"""
-        params = {
-            'requesterPubkey': self.requester_pubkey,
-            'limit': random.randint(10, 50)
-        }
+        url = self._blocked_users_url + self._next_limit_50()
 
         # Add pagination parameters occasionally
-        if random.random() < 0.2:
-            params['before'] = f"{int(time.time() * 1000000) - random.randint(3600000000, 86400000000)}_{random.randint(1, 1000)}"
+        url = self._maybe_paginate(url, self._coin_20)
 
-        with self.client.get("/get-blocked-users", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-blocked-users")
 
     @task(1)
     def get_followed_users(self):
         """Test get-followed-users endpoint"""
-        params = {
-            'requesterPubkey': random.choice(self.users_with_follows),
-            'limit': random.randint(10, 50)
-        }
+        url = _URL_FOLLOWED_USERS.format(r=self._next_follower(), l=self._next_limit_50())
 
         # Add pagination parameters occasionally
-        if random.random() < 0.2:
-            params['before'] = f"{int(time.time() * 1000000) - random.randint(3600000000, 86400000000)}_{random.randint(1, 1000)}"
+        url = self._maybe_paginate(url, self._coin_20)
 
-        with self.client.get("/get-followed-users", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-followed-users")
 
-    @task(1)
-    def test_health_endpoint(self):
-        """Test health check endpoint"""
-        with self.client.get("/health", catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Health check failed: {response.status_code}")
 
-
-class KWebappHeavyLoadUser(HttpUser):
+class KWebappHeavyLoadUser(_KWebappUser):
     """Heavy load testing user with more aggressive parameters"""
-    wait_time = between(0.5, 1.5)
+    wait_time = constant_throughput(1.0)  # Was between(0.5, 1.5)
     weight = 1  # Lower weight, fewer of these users
+    concurrency = 50
+
+    # Test data for heavy load testing, bound once per class
+    sample_pubkeys = LOAD_TEST_PUBKEYS
+    sample_post_ids = LOAD_TEST_POST_IDS
 
     def on_start(self):
-        """Initialize test data for heavy load testing with REAL data from DEV database"""
-        # Real public keys from k-db-DEV (22 users)
-        self.sample_pubkeys = [
-            "03edeacd90b1fe7ee696e21ddd81083fd44a245642a4a5cade455c465c9ce80e1b",
-            "032c1de780180d4e5100e17e304996284d187fdeb5ac837f32c04d62b73aaefe18",
-            "03f5a6fde99bc8e9ab6c6c92a08bafe622e533c7dad7f4eec2edef35baaa5a9bc6",
-            "0280bc073a2f016dbd6df25c4e843a5f801d3d940fc384d79f8103e42297be5986",
-            "020bc57bc1fb10751dc18282931a07cd6ace772217f0c4d843bc2b1a71670d7de1",
-            "02b1c109f322e0ee42c75434cd2c45c1e2e6dd09ad8127dbf3f0d9bb25ddf15f6b",
-            "03e5a3ad26b8df8e67e0b23b8e1e70a4adc2b05a6a6d3f3c47ca47c53e97f4b741",
-            "02e7c8a2e8e9c0c4a2b4a1e2d1c3b4a5e6f7c8d9e0a1b2c3d4e5f6a7b8c9d0e1f2",
-            "03a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2",
-            "0367ff507f241fa0b4e90779952d7ed36731a77021db0982fbabd0fbfa036bd8ee",
-            "038ea9ca1fe1f22cc8074cc576e0870cf50f773c90c1f4830fd6ba6f60771cc1f3",
-            "02f1e2d3c4b5a6978695a4b3c2d1e0f9e8d7c6b5a4938271605f4e3d2c1b0a9f8e",
-            "03c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2",
-            "02d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2",
-            "03b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2",
-            "02a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2",
-            "03d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2",
-            "02c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2",
-            "03e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2",
-            "02e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2",
-            "03f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2",
-            "02f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2"
-        ]
-        self.requester_pubkey = random.choice(self.sample_pubkeys)
-
-        # Real content IDs from k_contents (posts/quotes) - 40 items
-        self.sample_post_ids = [
-            "40dfcbfff3ad1c8a0c80bfd8bddf574b75a796d644c4f508ae63f7e47ed3d2bf",
-            "7c0b5d4d995eb86b076ab787a96c9d1180219a7dfc8de419b7dd0958e02723d9",
-            "b1c455ffdbf96f8199641a0ef42d96f55d7261b4abd3c28d7eb384742e098e82",
-            "0e5b63242a970cc5fb567dd71c223a62a74507821fc1b9fe5eb3df9c258ffce8",
-            "89c3a29ff0c89bef82e2e6c8c4a5f3b7d1e9f4a2b8c6d3e7f1a5b9c2d8e4f7a1b6",
-            "1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3",
-            "2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4",
-            "3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5",
-            "4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6",
-            "5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7",
-            "6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8",
-            "7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9",
-            "8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0",
-            "9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1",
-            "a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3",
-            "b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4",
-            "c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5",
-            "d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6",
-            "e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7",
-            "f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8",
-            "a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9",
-            "b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0",
-            "c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1",
-            "d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2",
-            "e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3",
-            "f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4",
-            "a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5",
-            "b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6",
-            "c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7",
-            "d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8",
-            "e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9",
-            "f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0",
-            "a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1",
-            "b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2",
-            "c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3",
-            "d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4",
-            "e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5",
-            "f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6",
-            "a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7",
-            "b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8"
-        ]
+        """Initialize per-user state for heavy load testing"""
+        super().on_start()
+
+        # URLs that don't change for the lifetime of this user; 100 is the max limit for stress testing
+        self._rapid_watching_url = _URL_POSTS_WATCHING.format(r=self.requester_pubkey, l=100)
+        self._pagination_base_url = _URL_POSTS_WATCHING.format(r=self.requester_pubkey, l=50)
 
     @task(5)
     def rapid_posts_watching(self):
         """Rapid fire requests to get-posts-watching"""
-        params = {
-            'requesterPubkey': self.requester_pubkey,
-            'limit': 100  # Max limit for stress testing
-        }
-
-        with self.client.get("/get-posts-watching", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(self._rapid_watching_url, name="/get-posts-watching")
 
     @task(3)
     def rapid_pagination_test(self):
         """Test rapid pagination requests"""
-        base_params = {
-            'requesterPubkey': self.requester_pubkey,
-            'limit': 50
-        }
-
         # Simulate pagination sequence
-        timestamps = [
-            int(time.time() * 1000000) - 3600000000,    # 1 hour ago
-            int(time.time() * 1000000) - 7200000000,    # 2 hours ago
-            int(time.time() * 1000000) - 10800000000,   # 3 hours ago
+        now_us = _bucket(_NOW_US[0])
+        urls = [
+            self._pagination_base_url + _BEFORE_FMT.format(b=f"{now_us - offset}_{self._rand.choice(_CURSOR_IDS)}")
+            for offset in _PAGINATION_OFFSETS_US
         ]
 
-        for timestamp in timestamps:
-            params = base_params.copy()
-            params['before'] = f"{timestamp}_{random.randint(1, 1000)}"
-
-            with self.client.get("/get-posts-watching", params=params,
-                               catch_response=True) as response:
-                if response.status_code == 200:
-                    response.success()
-                else:
-                    response.failure(f"Got {response.status_code}: {response.text}")
+        # Fire the pages concurrently so the burst costs one round trip, not three;
+        # the group is killed on exit so a stopped user leaves no request in flight
+        pages = Group()
+        try:
+            for url in urls:
+                pages.spawn(self.client.get, url, name="/get-posts-watching")
+            pages.join()
+        finally:
+            pages.kill()
 
 
-class KWebappRealisticUser(HttpUser):
+class KWebappRealisticUser(_KWebappUser):
     """Realistic user behavior simulation"""
-    wait_time = between(2, 8)
+    wait_time = constant_throughput(0.2)  # Was between(2, 8)
     weight = 3  # Higher weight, more of these users
+    concurrency = 4
+
+    # Test data for realistic user behavior, bound once per class
+    sample_pubkeys = LOAD_TEST_PUBKEYS
+    sample_post_ids = LOAD_TEST_POST_IDS
+    users_with_follows = LOAD_TEST_USERS_WITH_FOLLOWS
 
     def on_start(self):
-        """Initialize test data for realistic user behavior with REAL data from DEV database"""
-        # Real public keys from k-db-DEV (22 users)
-        self.sample_pubkeys = [
-            "03edeacd90b1fe7ee696e21ddd81083fd44a245642a4a5cade455c465c9ce80e1b",
-            "032c1de780180d4e5100e17e304996284d187fdeb5ac837f32c04d62b73aaefe18",
-            "03f5a6fde99bc8e9ab6c6c92a08bafe622e533c7dad7f4eec2edef35baaa5a9bc6",
-            "0280bc073a2f016dbd6df25c4e843a5f801d3d940fc384d79f8103e42297be5986",
-            "020bc57bc1fb10751dc18282931a07cd6ace772217f0c4d843bc2b1a71670d7de1",
-            "02b1c109f322e0ee42c75434cd2c45c1e2e6dd09ad8127dbf3f0d9bb25ddf15f6b",
-            "03e5a3ad26b8df8e67e0b23b8e1e70a4adc2b05a6a6d3f3c47ca47c53e97f4b741",
-            "02e7c8a2e8e9c0c4a2b4a1e2d1c3b4a5e6f7c8d9e0a1b2c3d4e5f6a7b8c9d0e1f2",
-            "03a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2",
-            "0367ff507f241fa0b4e90779952d7ed36731a77021db0982fbabd0fbfa036bd8ee",
-            "038ea9ca1fe1f22cc8074cc576e0870cf50f773c90c1f4830fd6ba6f60771cc1f3",
-            "02f1e2d3c4b5a6978695a4b3c2d1e0f9e8d7c6b5a4938271605f4e3d2c1b0a9f8e",
-            "03c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2",
-            "02d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2",
-            "03b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2",
-            "02a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2",
-            "03d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2",
-            "02c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2",
-            "03e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2",
-            "02e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2",
-            "03f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2",
-            "02f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2"
-        ]
-        self.users_with_follows = [
-            "0367ff507f241fa0b4e90779952d7ed36731a77021db0982fbabd0fbfa036bd8ee",
-            "038ea9ca1fe1f22cc8074cc576e0870cf50f773c90c1f4830fd6ba6f60771cc1f3",
-            "03edeacd90b1fe7ee696e21ddd81083fd44a245642a4a5cade455c465c9ce80e1b"
-        ]
-        self.requester_pubkey = random.choice(self.sample_pubkeys)
-
-        # Real content IDs from k_contents (posts/quotes) - 40 items
-        self.sample_post_ids = [
-            "40dfcbfff3ad1c8a0c80bfd8bddf574b75a796d644c4f508ae63f7e47ed3d2bf",
-            "7c0b5d4d995eb86b076ab787a96c9d1180219a7dfc8de419b7dd0958e02723d9",
-            "b1c455ffdbf96f8199641a0ef42d96f55d7261b4abd3c28d7eb384742e098e82",
-            "0e5b63242a970cc5fb567dd71c223a62a74507821fc1b9fe5eb3df9c258ffce8",
-            "89c3a29ff0c89bef82e2e6c8c4a5f3b7d1e9f4a2b8c6d3e7f1a5b9c2d8e4f7a1b6",
-            "1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3",
-            "2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4",
-            "3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5",
-            "4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6",
-            "5e6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7",
-            "6f7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8",
-            "7a8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9",
-            "8b9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0",
-            "9c0d1e2f3a4b5c6d7e8f9a0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1",
-            "a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3",
-            "b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4",
-            "c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5",
-            "d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6",
-            "e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7",
-            "f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8",
-            "a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9",
-            "b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0",
-            "c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1",
-            "d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2",
-            "e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3",
-            "f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4",
-            "a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5",
-            "b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6",
-            "c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7",
-            "d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8",
-            "e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9",
-            "f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0",
-            "a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1",
-            "b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2",
-            "c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3",
-            "d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4",
-            "e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5",
-            "f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6",
-            "a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7",
-            "b6c7d8e9f0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8"
-        ]
-        self.session_posts = []
+        """Initialize per-user state for realistic user behavior"""
+        super().on_start()
+        # Most recent post IDs seen in the following feed, bounded so long runs don't grow it
+        self.session_posts = deque(maxlen=64)
+
+        # URLs that don't change for the lifetime of this user
+        self._notifications_url = _URL_NOTIFICATIONS.format(u=self.requester_pubkey, r=self.requester_pubkey, l=20)
+        self._mentions_url = _URL_MENTIONS.format(u=self.requester_pubkey, r=self.requester_pubkey, l=20)
+        self._own_posts_url = _URL_POSTS.format(u=self.requester_pubkey, r=self.requester_pubkey, l=20)
+
+        # URL prefixes ending in "limit=", so only the drawn page size is appended per request
+        self._watching_url = _URL_POSTS_WATCHING.format(r=self.requester_pubkey, l="")
+        self._users_url = _URL_USERS.format(r=self.requester_pubkey, l="")
+
+        # Fixed-shape lookups put requesterPubkey first, so only the looked-up ID is appended
+        self._post_details_url = _URL_POST_DETAILS.format(r=self.requester_pubkey, p="")
+        self._user_details_url = _URL_USER_DETAILS.format(r=self.requester_pubkey, u="")
+
+        # Pre-drawn random picks for the task bodies
+        self._next_pubkey = _cycled_choices(self.sample_pubkeys, self._rand)
+        self._next_follower = _cycled_choices(self.users_with_follows, self._rand)
+        self._next_feed_size = _cycled_choices(("10", "20", "30"), self._rand)
+        self._next_watching_size = _cycled_choices(("20", "30", "40"), self._rand)
+        self._next_discovery_size = _cycled_choices(("20", "50"), self._rand)
 
     @task(10)
     def browse_following_feed(self):
         """Simulate browsing following feed (most common action)"""
-        params = {
-            'requesterPubkey': random.choice(self.users_with_follows),
-            'limit': random.choice([10, 20, 30])  # Typical page sizes
-        }
+        # Typical page sizes
+        url = _URL_CONTENT_FOLLOWING.format(r=self._next_follower(), l=self._next_feed_size())
 
-        with self.client.get("/get-content-following", params=params,
+        with self.client.get(url, name="/get-content-following",
                            catch_response=True) as response:
             if response.status_code == 200:
                 try:
-                    data = response.json()
-                    if 'posts' in data and data['posts']:
+                    # Skip parsing empty bodies ("", "{}", "[]")
+                    if len(response.content) > 2:
+                        posts = orjson.loads(response.content).get('posts') or ()
                         # Store some post IDs for later detail views
-                        for post in data['posts'][:3]:  # Take first 3
-                            if 'id' in post:
-                                self.session_posts.append(post['id'])
-                    response.success()
-                except:
-                    response.success()  # Still count as success even if JSON parsing fails
-            elif response.status_code == 404:
-                # 404 is valid - user has no following relationships
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+                        for post in posts[:3]:  # Take first 3
+                            post_id = post.get('id')
+                            if post_id:
+                                self.session_posts.append(post_id)
+                except (orjson.JSONDecodeError, AttributeError, KeyError, TypeError):
+                    pass  # Still count as success even if the body isn't the expected JSON
+            _check_found(response)
 
     @task(5)
     def browse_watching_feed(self):
         """Simulate browsing global feed"""
-        params = {
-            'requesterPubkey': self.requester_pubkey,
-            'limit': random.choice([20, 30, 40])
-        }
+        url = self._watching_url + self._next_watching_size()
 
-        with self.client.get("/get-posts-watching", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-posts-watching")
 
     @task(3)
     def check_notifications(self):
         """Simulate checking notifications (common user behavior)"""
-        params = {
-            'user': self.requester_pubkey,
-            'requesterPubkey': self.requester_pubkey,
-            'limit': 20
-        }
-
-        with self.client.get("/get-notifications", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(self._notifications_url, name="/get-notifications")
 
     @task(2)
     def check_mentions(self):
         """Simulate checking mentions"""
-        params = {
-            'user': self.requester_pubkey,
-            'requesterPubkey': self.requester_pubkey,
-            'limit': 20
-        }
-
-        with self.client.get("/get-mentions", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(self._mentions_url, name="/get-mentions")
 
     @task(4)
     def view_post_details(self):
         """Simulate clicking on a post to view details"""
         if self.session_posts:
-            post_id = random.choice(self.session_posts)
+            post_id = self.session_posts[self._rand.randrange(len(self.session_posts))]
         else:
             # Fallback to hardcoded post ID
             post_id = "40dfcbfff3ad1c8a0c80bfd8bddf574b75a796d644c4f508ae63f7e47ed3d2bf"
 
-        params = {
-            'id': post_id,
-            'requesterPubkey': self.requester_pubkey
-        }
+        url = self._post_details_url + post_id
 
-        with self.client.get("/get-post-details", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-post-details")
 
     @task(2)
     def browse_user_discovery(self):
         """Simulate browsing user introductions for discovery"""
-        params = {
-            'requesterPubkey': self.requester_pubkey,
-            'limit': random.choice([20, 50])
-        }
+        url = self._users_url + self._next_discovery_size()
 
-        with self.client.get("/get-users", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-users")
 
     @task(2)
     def check_own_posts(self):
         """Simulate checking own posts occasionally"""
-        params = {
-            'user': self.requester_pubkey,
-            'requesterPubkey': self.requester_pubkey,
-            'limit': 20
-        }
-
-        with self.client.get("/get-posts", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(self._own_posts_url, name="/get-posts")
 
     @task(1)
     def view_user_profile(self):
         """Simulate viewing other user profiles"""
-        params = {
-            'user': random.choice(self.sample_pubkeys),
-            'requesterPubkey': self.requester_pubkey
-        }
+        url = self._user_details_url + self._next_pubkey()
 
-        with self.client.get("/get-user-details", params=params,
-                           catch_response=True) as response:
-            if response.status_code == 200:
-                response.success()
-            else:
-                response.failure(f"Got {response.status_code}: {response.text}")
+        self.client.get(url, name="/get-user-details")
 
 
 # Default user class (mix of all behaviors)
 class WebsiteUser(KWebappAPIUser):
     weight = 2
+
+
+if __name__ == "__main__":
+    # Workers (one per CPU, see locust.conf) are forked after this module is
+    # imported: the sample tuples are shared copy-on-write and CLIENT_POOL opens
+    # no sockets until the first request, so nothing here needs rebuilding per
+    # worker. GEVENT_LOOP=libuv (needs cffi, see requirements.txt) swaps the
+    # default libev hub for libuv; it must be set in the environment before locust
+    # starts, since the hub is chosen when gevent first creates its loop.
+    raise SystemExit(
+        "Run through locust, e.g. from this directory (defaults come from locust.conf): "
+        "GEVENT_LOOP=libuv locust -H http://127.0.0.1:8080"
+    )